@@ -6,7 +6,7 @@ This script automates the release process including:
 - Version updates across the codebase
 - Git commits and tagging
 - Multi-platform builds
-- Binary compression
+- Binary compression (zip and .tar.zst; the latter needs `pip install zstandard`)
 - GitHub release publication
 
 Usage:
@@ -17,15 +17,109 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
+import re
+import shlex
 import subprocess
 import sys
+import tarfile
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Only needed to build/publish; preflight reports it as missing
+    zstandard = None
+
+
+@dataclass(frozen=True)
+class PlatformArtifacts:
+    """Names and paths of one platform's build output and release artifacts"""
+
+    platform: str
+    extension: str
+    human_name: str
+    build_output_path: Path  # Binary produced by cross
+    binary_path: Path  # Versioned binary name, as stored inside the zip
+    zip_path: Path
+    tar_zst_path: Path
+
+
+class _GitBatch:
+    """
+    Long-lived 'git cat-file --batch' process for reading files at a revision
+
+    Serves any number of lookups from one git process instead of spawning
+    'git show' per file. Use as a context manager.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._process = None
+
+    def __enter__(self) -> "_GitBatch":
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        self._process.stdin.close()
+        self._process.stdout.close()
+        self._process.wait()
+
+    def get(self, rev: str, path: str) -> Optional[str]:
+        """
+        Read a file's contents at a revision
+
+        Args:
+            rev: Commit, tag or branch name
+            path: File path relative to the repository root
+
+        Returns:
+            The file contents, or None if the revision or path does not exist
+        """
+        self._process.stdin.write(f"{rev}:{path}\n".encode())
+        self._process.stdin.flush()
+
+        # "<oid> <type> <size>" on success, "<object> missing"/"<object> ambiguous"
+        # otherwise; the echoed object name may contain spaces, so split from the right
+        header = self._process.stdout.readline().rstrip(b"\n")
+        if header.endswith((b" missing", b" ambiguous")):
+            return None
+
+        _, object_type, size = header.rsplit(b" ", 2)
+        content = self._process.stdout.read(int(size))
+        self._process.stdout.read(1)  # Trailing newline after the contents
+        if object_type != b"blob":
+            return None
+        return content.decode("utf-8", errors="replace")
 
 
 class ReleaseAutomation:
     """Handles the complete release automation workflow"""
 
+    # Upstream cross repository, and the installed commit as reported by
+    # `cross --version` for a git install (e.g. "cross 0.2.5 (4090bec 2024-05-27)")
+    CROSS_GIT_URL = "https://github.com/cross-rs/cross"
+    CROSS_COMMIT_RE = re.compile(r"^cross \S+ \(([0-9a-f]{7,40})\b", re.MULTILINE)
+
+    # Prebuilt cross images, and the platforms cross-rs publishes no image for
+    CROSS_IMAGE = "ghcr.io/cross-rs/{platform}:main"
+    CROSS_IMAGELESS_PLATFORMS = {"aarch64-apple-darwin", "x86_64-apple-darwin"}
+
     # Cross-compilation platforms (fixed set)
     PLATFORMS = [
         "aarch64-apple-darwin",
@@ -35,12 +129,61 @@ class ReleaseAutomation:
         "x86_64-unknown-linux-gnu",
     ]
 
+    # Sources that affect the release binaries (used to fingerprint builds)
+    SOURCE_PATHS = [
+        "adaptive_pipeline",
+        "adaptive_pipeline_bootstrap",
+        "adaptive_pipeline_domain",
+        "Cargo.toml",
+        "Cargo.lock",
+    ]
+
+    # Sources git ignores in this tree, so they are hashed from disk
+    IGNORED_SOURCE_FILES = ["Cargo.lock"]
+
+    # Version/date lines rewritten by step 2 (replacements are filled in per release)
+    CARGO_VERSION_RE = re.compile(r'^version = ".*"', re.MULTILINE)
+    CARGO_DOMAIN_DEP_RE = re.compile(r'^(.*adaptive-pipeline-domain.*?)version = "[^"]*"', re.MULTILINE)
+    CARGO_BOOTSTRAP_DEP_RE = re.compile(r'^(.*adaptive-pipeline-bootstrap.*?)version = "[^"]*"', re.MULTILINE)
+    DOC_ANY_VERSION_RE = re.compile(r'^\*\*Version:\*\* .*', re.MULTILINE)
+    DOC_VERSION_RE = re.compile(r'^\*\*Version:\*\* \d+\.\d+\.\d+', re.MULTILINE)
+    DOC_DATE_RE = re.compile(r'^\*\*Date:\*\* .*', re.MULTILINE)
+    ROADMAP_VERSION_RE = re.compile(r'^\*\*Version\*\*: \d+\.\d+\.\d+', re.MULTILINE)
+
+    # Documentation trees whose markdown headers carry the version and date
+    DOC_TREES = ["adaptive_pipeline/docs/src", "docs/src"]
+
+    # Number of trailing output lines kept per command for error reporting
+    OUTPUT_TAIL_LINES = 500
+
+    # Number of trailing log lines printed when a heavy (logged) command fails
+    LOG_TAIL_LINES = 200
+
     # Platform-specific binary extensions
     PLATFORM_EXTENSIONS = {
         "x86_64-pc-windows-gnu": ".exe",
     }
 
-    def __init__(self, version: str, repo_path: str, dry_run: bool = False):
+    # Human-readable platform names used in release artifact names
+    PLATFORM_FRIENDLY_NAMES = {
+        "aarch64-apple-darwin": "macos-aarch64",
+        "aarch64-unknown-linux-gnu": "linux-aarch64",
+        "x86_64-apple-darwin": "macos-x86_64",
+        "x86_64-pc-windows-gnu": "windows-x86_64",
+        "x86_64-unknown-linux-gnu": "linux-x86_64",
+    }
+
+    def __init__(
+        self,
+        version: str,
+        repo_path: str,
+        dry_run: bool = False,
+        jobs: int = None,
+        refresh_tools: bool = False,
+        serial: bool = False,
+        parallel_prep: bool = False,
+        now: Optional[datetime] = None,
+    ):
         """
         Initialize release automation
 
@@ -48,15 +191,42 @@ class ReleaseAutomation:
             version: Release version (e.g., "2.0.0")
             repo_path: Path to repository root
             dry_run: If True, print commands without executing
+            jobs: Number of platforms to build concurrently
+                  (defaults to min(len(PLATFORMS), cpu count / 2))
+            refresh_tools: If True, reinstall cross even if it is up to date
+            serial: If True, never overlap the build with the prep steps
+            parallel_prep: If True, run steps 1 and 2 concurrently
+            now: Release timestamp used for documentation dates (defaults to now)
         """
         self.version = version
         self.repo_path = Path(repo_path).resolve()
         self.dry_run = dry_run
+        self.jobs = jobs or default_jobs()
+        self.refresh_tools = refresh_tools
+        self.serial = serial
+        self.parallel_prep = parallel_prep
+        self._date_str = (now or datetime.now()).strftime("%B %d, %Y")
+
+        # Files edited by step 2, staged explicitly by step 3
+        self._modified_paths = set()
+
+        # Running cross processes of step 7, terminated if an overlapped prep step fails
+        self._cancel_build = threading.Event()
+        self._build_processes: Dict[str, subprocess.Popen] = {}
+        self._build_lock = threading.Lock()
 
         # Validate inputs
         self._validate_version()
         self._validate_repo_path()
 
+        # Per-platform cargo target directories (cargo locks the whole target dir during
+        # a build, so concurrent cross builds sharing one would serialize), the release
+        # directories inside them, and the artifact names/paths there, shared by the
+        # build, compress and publish steps
+        self._cargo_target_dirs = {p: self._target_dir / f"cross-{p}" for p in self.PLATFORMS}
+        self._release_dirs = {p: self._cargo_target_dirs[p] / p / "release" for p in self.PLATFORMS}
+        self._artifacts = self._build_artifacts()
+
     def _validate_version(self):
         """Validate version format (semantic versioning)"""
         parts = self.version.split(".")
@@ -73,42 +243,149 @@ class ReleaseAutomation:
             print(f"❌ Error: Not a git repository: {self.repo_path}")
             sys.exit(1)
 
-    def _run_command(self, cmd: str, description: str, cwd: Path = None) -> Tuple[bool, str]:
+    def preflight(self, prep: bool, build: bool, publish: bool) -> bool:
+        """
+        Check up front that everything the requested phases need is available
+
+        All checks run concurrently and every failure is reported, so a
+        missing tool is caught before any real work rather than after a
+        long build.
+
+        Args:
+            prep: Whether the prep phase (steps 1-6b) will run
+            build: Whether the build phase (steps 7-8) will run
+            publish: Whether the publish phase (step 9) will run
+
+        Returns:
+            True if all checks passed
+        """
+        def succeeded(result: subprocess.CompletedProcess) -> bool:
+            return result.returncode == 0
+
+        # (description, command, predicate on the completed process)
+        checks = [("git is available", ["git", "--version"], succeeded)]
+        if prep:
+            checks += [
+                # Untracked files (e.g. target/) are never committed by the release
+                ("Working tree is clean", ["git", "status", "--porcelain", "--untracked-files=no"],
+                 lambda result: result.returncode == 0 and not result.stdout.strip()),
+                (f"Tag v{self.version} does not exist yet",
+                 ["git", "rev-parse", "--verify", "--quiet", f"refs/tags/v{self.version}"],
+                 lambda result: result.returncode != 0),
+                ("cargo is available", ["cargo", "--version"], succeeded),
+            ]
+        if prep or build:
+            checks += [
+                ("Docker daemon is running", ["docker", "info"], succeeded),
+                ("rustup is available", ["rustup", "--version"], succeeded),
+            ]
+        if build and not prep:
+            checks.append(("cross is installed", ["cross", "--version"], succeeded))
+        if build or publish:
+            # Every release ships .tar.zst archives, so the build and publish machines must agree
+            checks.append(("Python module 'zstandard' is installed (pip install zstandard)",
+                           [sys.executable, "-c", "import zstandard"], succeeded))
+        if publish:
+            checks.append(("GitHub CLI is authenticated", ["gh", "auth", "status"], succeeded))
+
+        def run_check(check) -> bool:
+            _, cmd, predicate = check
+            try:
+                result = subprocess.run(cmd, cwd=self.repo_path, capture_output=True, text=True, timeout=60)
+            except (OSError, subprocess.TimeoutExpired):
+                return False
+            return predicate(result)
+
+        print("⏳ Running preflight checks...")
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(run_check, checks))
+
+        failed_checks = [description for (description, _, _), ok in zip(checks, results) if not ok]
+        if failed_checks:
+            print("❌ Preflight checks failed:")
+            for description in failed_checks:
+                print(f"   - {description}")
+            return False
+
+        print(f"✅ All {len(checks)} preflight checks passed")
+        return True
+
+    @cached_property
+    def _target_dir(self) -> Path:
+        """Cargo target directory of the repository"""
+        return self.repo_path / "target"
+
+    def _release_log_path(self) -> Path:
+        """Get the path of the log that heavy commands write to"""
+        return self._target_dir / "release.log"
+
+    def _run_command(
+        self,
+        cmd: List[str],
+        description: str,
+        cwd: Path = None,
+        stdin_text: str = None,
+        heavy: bool = False,
+        quiet: bool = False,
+    ) -> Tuple[bool, str]:
         """
-        Run a shell command with error handling and real-time output streaming
+        Run a command with error handling and real-time output streaming
+
+        The command is executed directly (no intermediate shell). Output is
+        echoed as it arrives and only the last OUTPUT_TAIL_LINES lines are
+        retained, so memory stays bounded however verbose the command is.
+
+        Heavy commands (long, verbose builds) instead write straight to
+        target/release.log; its last LOG_TAIL_LINES lines are printed if the
+        command fails.
 
         Args:
-            cmd: Command to execute
+            cmd: Command to execute as an argv list
             description: Human-readable description
             cwd: Working directory (defaults to repo_path)
+            stdin_text: Optional text to feed to the command's stdin
+            heavy: If True, send output to the release log instead of the console
+            quiet: If True, print nothing and leave reporting to the caller
+                   (for commands run concurrently, see _format_command_result)
 
         Returns:
-            Tuple of (success, output)
+            Tuple of (success, tail of output)
         """
         if cwd is None:
             cwd = self.repo_path
 
         if self.dry_run:
             print(f"[DRY RUN] {description}")
-            print(f"          Command: {cmd}")
+            print(f"          Command: {shlex.join(cmd)}")
             print(f"          Working dir: {cwd}")
             return True, ""
 
+        if quiet:
+            return self._run_quiet_command(cmd, cwd, stdin_text)
+
         print(f"⏳ {description}...")
+        if heavy:
+            return self._run_logged_command(cmd, description, cwd, stdin_text)
+
         try:
             # Use Popen for real-time output streaming
             process = subprocess.Popen(
                 cmd,
-                shell=True,
                 cwd=cwd,
+                env=os.environ,
+                stdin=subprocess.PIPE if stdin_text is not None else None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Merge stderr into stdout
                 text=True,
                 bufsize=1,  # Line buffered
             )
 
+            if stdin_text is not None:
+                process.stdin.write(stdin_text)
+                process.stdin.close()
+
             # Stream output in real-time
-            output_lines = []
+            output_lines = deque(maxlen=self.OUTPUT_TAIL_LINES)
             for line in process.stdout:
                 print(line, end='')  # Print immediately
                 output_lines.append(line)
@@ -119,7 +396,7 @@ class ReleaseAutomation:
 
             if process.returncode != 0:
                 print(f"❌ Failed: {description}")
-                print(f"   Command: {cmd}")
+                print(f"   Command: {shlex.join(cmd)}")
                 print(f"   Exit code: {process.returncode}")
                 return False, output
 
@@ -131,27 +408,193 @@ class ReleaseAutomation:
             print(f"   Error: {e}")
             return False, str(e)
 
-    def _get_binary_path(self, platform: str) -> Path:
-        """Get the path to a platform-specific binary"""
-        extension = self.PLATFORM_EXTENSIONS.get(platform, "")
-        binary_name = f"adaptive_pipeline-v{self.version}-{self._platform_to_name(platform)}{extension}"
-        return self.repo_path / "target" / platform / "release" / binary_name
-
-    def _get_zip_path(self, platform: str) -> Path:
-        """Get the path to a platform-specific zip file"""
-        zip_name = f"adaptive_pipeline-v{self.version}-{self._platform_to_name(platform)}.zip"
-        return self.repo_path / "target" / platform / "release" / zip_name
-
-    def _platform_to_name(self, platform: str) -> str:
-        """Convert platform triple to human-readable name"""
-        mappings = {
-            "aarch64-apple-darwin": "macos-aarch64",
-            "aarch64-unknown-linux-gnu": "linux-aarch64",
-            "x86_64-apple-darwin": "macos-x86_64",
-            "x86_64-pc-windows-gnu": "windows-x86_64",
-            "x86_64-unknown-linux-gnu": "linux-x86_64",
-        }
-        return mappings.get(platform, platform)
+    def _run_quiet_command(self, cmd: List[str], cwd: Path, stdin_text: str = None) -> Tuple[bool, str]:
+        """Run a command with its output captured instead of printed (see _run_command)"""
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                env=os.environ,
+                input=stdin_text,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # Merge stderr into stdout
+                text=True,
+            )
+        except Exception as e:
+            return False, f"Error: {e}\n"
+
+        output = "".join(deque(result.stdout.splitlines(keepends=True), maxlen=self.OUTPUT_TAIL_LINES))
+        if result.returncode != 0:
+            return False, output + f"Command: {shlex.join(cmd)}\nExit code: {result.returncode}\n"
+        return True, output
+
+    @staticmethod
+    def _format_command_result(description: str, success: bool, output: str) -> str:
+        """Format the outcome of a quiet command as one block, to be printed in one call"""
+        if success:
+            return f"✅ {description}"
+        lines = [f"❌ Failed: {description}"]
+        lines += [f"   {line}" for line in output.splitlines()]
+        return "\n".join(lines)
+
+    def _run_logged_command(
+        self, cmd: List[str], description: str, cwd: Path, stdin_text: str = None
+    ) -> Tuple[bool, str]:
+        """Run a heavy command with its output appended to the release log (see _run_command)"""
+        log_path = self._release_log_path()
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, "a") as log:
+                log.write(f"\n$ {shlex.join(cmd)}\n")
+                log.flush()
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=cwd,
+                    env=os.environ,
+                    stdin=subprocess.PIPE if stdin_text is not None else None,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,  # Merge stderr into stdout
+                    text=True,
+                )
+                if stdin_text is not None:
+                    process.stdin.write(stdin_text)
+                    process.stdin.close()
+                process.wait()
+
+            with open(log_path, errors="replace") as log:
+                output = "".join(deque(log, maxlen=self.LOG_TAIL_LINES))
+        except Exception as e:
+            print(f"❌ Exception during: {description}")
+            print(f"   Error: {e}")
+            return False, str(e)
+
+        if process.returncode != 0:
+            print(f"----- last {self.LOG_TAIL_LINES} lines of {log_path} -----")
+            print(output, end="")
+            print(f"❌ Failed: {description}")
+            print(f"   Command: {shlex.join(cmd)}")
+            print(f"   Exit code: {process.returncode}")
+            return False, output
+
+        print(f"✅ {description} (log: {log_path})")
+        return True, output
+
+    def _build_artifacts(self) -> Dict[str, PlatformArtifacts]:
+        """Precompute the artifact names and paths of every platform"""
+        artifacts = {}
+        for platform in self.PLATFORMS:
+            extension = self.PLATFORM_EXTENSIONS.get(platform, "")
+            human_name = self.PLATFORM_FRIENDLY_NAMES.get(platform, platform)
+            release_dir = self._release_dirs[platform]
+            artifact_name = f"adaptive_pipeline-v{self.version}-{human_name}"
+            artifacts[platform] = PlatformArtifacts(
+                platform=platform,
+                extension=extension,
+                human_name=human_name,
+                build_output_path=release_dir / f"adaptive_pipeline{extension}",
+                binary_path=release_dir / f"{artifact_name}{extension}",
+                zip_path=release_dir / f"{artifact_name}.zip",
+                tar_zst_path=release_dir / f"{artifact_name}.tar.zst",
+            )
+        return artifacts
+
+    def _release_notes(self) -> str:
+        """
+        Extract the current version's section from CHANGELOG.md
+
+        Reads the CHANGELOG.md committed at the release tag, so the notes match
+        what was tagged; falls back to the working tree before the tag exists.
+        """
+        try:
+            with _GitBatch(self.repo_path) as git:
+                changelog = git.get(f"v{self.version}", "CHANGELOG.md")
+        except OSError:
+            changelog = None
+
+        if changelog is None:
+            changelog_path = self.repo_path / "CHANGELOG.md"
+            if not changelog_path.exists():
+                return ""
+            changelog = changelog_path.read_text()
+
+        # Find "## [version]" header, keep lines until next "## [" header or EOF
+        notes = []
+        in_section = False
+        for line in changelog.splitlines(keepends=True):
+            if line.startswith(f"## [{self.version}]"):
+                in_section = True
+            elif line.startswith("## [") and in_section:
+                break
+            if in_section:
+                notes.append(line)
+        return "".join(notes)
+
+    def _patch_file(self, path: str, patches: List[Tuple[Pattern, str]]) -> bool:
+        """
+        Apply regex substitutions to a file in place
+
+        The file is only rewritten when its content actually changes, so
+        untouched files keep their mtime (and don't trigger rebuilds).
+
+        Args:
+            path: File to edit, relative to the repository root
+            patches: (compiled pattern, replacement) pairs, applied in order
+
+        Returns:
+            True if the file was read (and, if needed, written) successfully
+        """
+        file_path = self.repo_path / path
+        try:
+            with open(file_path, encoding="utf-8", newline="") as f:
+                original = f.read()
+            content = original
+            substitutions = 0
+            for pattern, replacement in patches:
+                content, count = pattern.subn(replacement, content)
+                substitutions += count
+
+            if content == original:
+                return True
+
+            self._modified_paths.add(path)
+            if self.dry_run:
+                print(f"[DRY RUN] Update {path} ({substitutions} substitutions)")
+                return True
+
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+        except OSError as e:
+            print(f"❌ Failed to update {path}")
+            print(f"   Error: {e}")
+            return False
+
+        return True
+
+    def _cross_upstream_sha(self) -> str:
+        """Get the commit at the head of the upstream cross repository ("" if unknown)"""
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", self.CROSS_GIT_URL, "HEAD"],
+                capture_output=True, text=True, timeout=30,
+            )
+        except Exception:
+            return ""
+        if result.returncode != 0 or not result.stdout.strip():
+            return ""
+        return result.stdout.split()[0]
+
+    def _cross_is_current(self, upstream_sha: str) -> bool:
+        """Check whether the installed cross was built from the upstream commit"""
+        if not upstream_sha:
+            return False
+        try:
+            result = subprocess.run(["cross", "--version"], capture_output=True, text=True)
+        except FileNotFoundError:
+            return False
+        if result.returncode != 0:
+            return False
+        match = self.CROSS_COMMIT_RE.search(result.stdout)
+        return bool(match) and upstream_sha.startswith(match.group(1))
 
     def step_1_prepare_environment(self) -> bool:
         """Step 1: Prepare build environment"""
@@ -159,20 +602,91 @@ class ReleaseAutomation:
         print("STEP 1: Prepare Environment")
         print("=" * 70)
 
-        commands = [
-            ("cargo install cross --locked --git https://github.com/cross-rs/cross --force",
-             "Install/update cross compiler"),
-            ("cross --version", "Verify cross installation"),
-            ("unset CROSS_NO_DOCKER || true", "Unset CROSS_NO_DOCKER"),
-            ("export CROSS_CONTAINER_ENGINE=docker", "Set container engine to Docker"),
-        ]
+        # Configure cross for this process; exported variables are inherited by
+        # every cross invocation from here on, including the version check below
+        os.environ.pop("CROSS_NO_DOCKER", None)
+        os.environ["CROSS_CONTAINER_ENGINE"] = "docker"
+        print("✅ Set container engine to Docker")
 
-        for cmd, desc in commands:
-            success, _ = self._run_command(cmd, desc)
+        # Use BuildKit for any images cross has to build
+        os.environ["DOCKER_BUILDKIT"] = "1"
+        print("✅ Enabled Docker BuildKit")
+
+        install_cmd = ["cargo", "install", "cross", "--locked", "--git", self.CROSS_GIT_URL]
+        if self.refresh_tools:
+            install_cmd.append("--force")
+
+        # Skip the (slow) cross build when the installed commit matches upstream
+        upstream_sha = "" if self.dry_run else self._cross_upstream_sha()
+        install_needed = self.refresh_tools or not self._cross_is_current(upstream_sha)
+
+        commands = []
+        if install_needed:
+            commands.append((install_cmd, "Install/update cross compiler", True))
+        else:
+            print(f"ℹ️  cross is up to date ({upstream_sha[:7]}), skipping install")
+        commands.append((["cross", "--version"], "Verify cross installation", False))
+
+        for cmd, desc, heavy in commands:
+            success, _ = self._run_command(cmd, desc, heavy=heavy)
             if not success:
                 print(f"❌ Environment preparation failed at: {desc}")
                 return False
 
+        self._pull_cross_images()
+        return True
+
+    def _pull_cross_images(self):
+        """
+        Pre-pull the cross images for every platform that has one
+
+        Pulling up front (concurrently) means the builds start from a warm
+        local image cache. Failures are not fatal: cross pulls or builds the
+        image itself when a build needs it.
+        """
+        platforms = [p for p in self.PLATFORMS if p not in self.CROSS_IMAGELESS_PLATFORMS]
+
+        images = [self.CROSS_IMAGE.format(platform=platform) for platform in platforms]
+
+        def pull(image: str) -> Tuple[bool, str]:
+            return self._run_command(["docker", "pull", "--quiet", image], f"Pull {image}", quiet=True)
+
+        if self.dry_run:
+            results = [pull(image) for image in images]
+        else:
+            # Pull quietly and report once all are done, so the outputs do not interleave
+            print(f"⏳ Pulling {len(images)} cross images...")
+            with ThreadPoolExecutor(max_workers=len(images)) as executor:
+                results = list(executor.map(pull, images))
+            for image, (success, output) in zip(images, results):
+                print(self._format_command_result(f"Pull {image}", success, output))
+
+        missing = [platform for platform, (success, _) in zip(platforms, results) if not success]
+        if missing:
+            print(f"ℹ️  No prebuilt cross image pulled for: {', '.join(missing)} (cross will build them)")
+
+    def _bump_doc_versions(self) -> bool:
+        """
+        Update the version and date headers of every markdown file in the doc trees
+
+        The introductions take any version string, other pages only X.Y.Z.
+        Files whose headers are already current are left untouched.
+
+        Returns:
+            True if every file was processed successfully
+        """
+        date_header = (self.DOC_DATE_RE, f"**Date:** {self._date_str}")
+        page_patches = [(self.DOC_VERSION_RE, f"**Version:** {self.version}"), date_header]
+        intro_patches = [(self.DOC_ANY_VERSION_RE, f"**Version:** {self.version}"), date_header]
+
+        for doc_tree in self.DOC_TREES:
+            tree_root = self.repo_path / doc_tree
+            intro_path = tree_root / "introduction.md"
+            for md_path in sorted(tree_root.rglob("*.md")):
+                patches = intro_patches if md_path == intro_path else page_patches
+                if not self._patch_file(str(md_path.relative_to(self.repo_path)), patches):
+                    return False
+
         return True
 
     def step_2_set_version(self) -> bool:
@@ -181,122 +695,101 @@ class ReleaseAutomation:
         print(f"STEP 2: Set Version to v{self.version}")
         print("=" * 70)
 
-        # Get current date
-        from datetime import datetime
-        date_str = datetime.now().strftime("%B %d, %Y")
+        version_line = (self.CARGO_VERSION_RE, f'version = "{self.version}"')
+
+        # Cargo.toml files
+        file_updates = {
+            "adaptive_pipeline/Cargo.toml": [
+                version_line,
+                (self.CARGO_DOMAIN_DEP_RE, f'\\g<1>version = "{self.version}"'),
+                (self.CARGO_BOOTSTRAP_DEP_RE, f'\\g<1>version = "{self.version}"'),
+            ],
+            "adaptive_pipeline_domain/Cargo.toml": [version_line],
+            "adaptive_pipeline_bootstrap/Cargo.toml": [version_line],
+        }
 
-        # Update Cargo.toml files
-        print("Updating Cargo.toml files...")
+        # Roadmap
+        file_updates["docs/roadmap.md"] = [(self.ROADMAP_VERSION_RE, f"**Version**: {self.version}")]
 
-        # Update main Cargo.toml - package version
-        cmd = f"sed -i '' 's/^version = \".*\"/version = \"{self.version}\"/' adaptive_pipeline/Cargo.toml"
-        success, _ = self._run_command(cmd, "Update adaptive_pipeline/Cargo.toml package version")
-        if not success:
-            return False
+        print("Updating Cargo.toml files and roadmap...")
+        for path, patches in file_updates.items():
+            if not self._patch_file(path, patches):
+                return False
 
-        # Update main Cargo.toml - domain dependency version
-        # Use multiple sed passes to avoid complex escaping issues
-        cmd = f"sed -i '' '/adaptive-pipeline-domain/s/version = \"[^\"]*\"/version = \"{self.version}\"/' adaptive_pipeline/Cargo.toml"
-        success, _ = self._run_command(cmd, "Update adaptive_pipeline/Cargo.toml domain dependency")
-        if not success:
+        print("Updating documentation files...")
+        if not self._bump_doc_versions():
             return False
 
-        # Update main Cargo.toml - bootstrap dependency version
-        cmd = f"sed -i '' '/adaptive-pipeline-bootstrap/s/version = \"[^\"]*\"/version = \"{self.version}\"/' adaptive_pipeline/Cargo.toml"
-        success, _ = self._run_command(cmd, "Update adaptive_pipeline/Cargo.toml bootstrap dependency")
-        if not success:
-            return False
+        print(f"✅ Version updated to v{self.version} ({self._date_str})")
+        return True
 
-        # Update domain Cargo.toml
-        cmd = f"sed -i '' 's/^version = \".*\"/version = \"{self.version}\"/' adaptive_pipeline_domain/Cargo.toml"
-        success, _ = self._run_command(cmd, "Update adaptive_pipeline_domain/Cargo.toml")
-        if not success:
-            return False
+    def _has_changes(self, paths: List[str], description: str) -> Optional[bool]:
+        """
+        Check whether tracked files differ from HEAD (staged or not)
 
-        # Update bootstrap Cargo.toml
-        cmd = f"sed -i '' 's/^version = \".*\"/version = \"{self.version}\"/' adaptive_pipeline_bootstrap/Cargo.toml"
-        success, _ = self._run_command(cmd, "Update adaptive_pipeline_bootstrap/Cargo.toml")
-        if not success:
-            return False
+        Uses the exit status of 'git diff --quiet' rather than parsing
+        'git status' output, so untracked files are never scanned.
 
-        # Update documentation files
-        print("Updating documentation files...")
+        Args:
+            paths: Paths to check
+            description: Human-readable description
 
-        doc_updates = [
-            ("docs/src/introduction.md", [
-                (r'^\*\*Version:\*\* .*', f'**Version:** {self.version}'),
-                (r'^\*\*Date:\*\* .*', f'**Date:** {date_str}'),
-            ]),
-            ("adaptive_pipeline/docs/src/introduction.md", [
-                (r'^\*\*Version:\*\* .*', f'**Version:** {self.version}'),
-                (r'^\*\*Date:\*\* .*', f'**Date:** {date_str}'),
-            ]),
+        Returns:
+            True/False for changes, or None if git failed
+        """
+        checks = [
+            ["git", "diff", "--quiet", "--", *paths],
+            ["git", "diff", "--cached", "--quiet", "--", *paths],
         ]
 
-        for file_path, replacements in doc_updates:
-            for pattern, replacement in replacements:
-                cmd = f"sed -i '' 's/{pattern}/{replacement}/' {file_path}"
-                success, _ = self._run_command(cmd, f"Update {file_path}")
-                if not success:
-                    return False
-
-        # Update all documentation markdown files with version headers
-        cmd = f"find adaptive_pipeline/docs/src -name '*.md' -type f -exec sed -i '' 's/^\\*\\*Version:\\*\\* [0-9]\\+\\.[0-9]\\+\\.[0-9]\\+/**Version:** {self.version}/' {{}} \\;"
-        success, _ = self._run_command(cmd, "Update version in all adaptive_pipeline/docs/src/**/*.md files")
-        if not success:
-            return False
-
-        # Update all documentation markdown files with date headers
-        cmd = f"find adaptive_pipeline/docs/src -name '*.md' -type f -exec sed -i '' 's/^\\*\\*Date:\\*\\* .*/**Date:** {date_str}/' {{}} \\;"
-        success, _ = self._run_command(cmd, "Update date in all adaptive_pipeline/docs/src/**/*.md files")
-        if not success:
-            return False
-
-        # Update main docs (docs/src) - version
-        cmd = f"find docs/src -name '*.md' -type f -exec sed -i '' 's/^\\*\\*Version:\\*\\* [0-9]\\+\\.[0-9]\\+\\.[0-9]\\+/**Version:** {self.version}/' {{}} \\;"
-        success, _ = self._run_command(cmd, "Update version in all docs/src/**/*.md files")
-        if not success:
-            return False
-
-        # Update main docs (docs/src) - date
-        cmd = f"find docs/src -name '*.md' -type f -exec sed -i '' 's/^\\*\\*Date:\\*\\* .*/**Date:** {date_str}/' {{}} \\;"
-        success, _ = self._run_command(cmd, "Update date in all docs/src/**/*.md files")
-        if not success:
-            return False
-
-        # Update roadmap
-        cmd = f"sed -i '' 's/^\\*\\*Version\\*\\*: [0-9]\\+\\.[0-9]\\+\\.[0-9]\\+/**Version**: {self.version}/' docs/roadmap.md"
-        success, _ = self._run_command(cmd, "Update docs/roadmap.md")
-        if not success:
-            return False
+        if self.dry_run:
+            print(f"[DRY RUN] {description}")
+            for cmd in checks:
+                print(f"          Command: {shlex.join(cmd)}")
+            return True
 
-        print(f"✅ Version updated to v{self.version} ({date_str})")
-        return True
+        for cmd in checks:
+            returncode = subprocess.run(cmd, cwd=self.repo_path).returncode
+            if returncode == 1:
+                return True
+            if returncode != 0:
+                print(f"❌ Failed: {description}")
+                print(f"   Command: {shlex.join(cmd)}")
+                print(f"   Exit code: {returncode}")
+                return None
+        return False
 
     def step_3_commit_changes(self, message: str) -> bool:
-        """Step 3: Commit version changes"""
+        """Step 3: Commit version changes (pushed in step 6b)"""
         print("\n" + "=" * 70)
         print("STEP 3: Commit Version Changes")
         print("=" * 70)
 
-        # Check if there are changes to commit
-        success, output = self._run_command(
-            "git status --porcelain",
-            "Check for uncommitted changes"
-        )
+        if not self._modified_paths:
+            print("ℹ️  No files were updated by step 2, skipping")
+            return True
 
-        if not success:
+        # Check if there are changes to commit
+        has_changes = self._has_changes(sorted(self._modified_paths), "Check for uncommitted changes")
+        if has_changes is None:
             return False
 
-        if not output.strip():
+        if not has_changes:
             print("ℹ️  No changes to commit, skipping")
             return True
 
-        success, _ = self._run_command(
-            f'git add . && git commit -m "{message}" && git push',
-            "Commit and push version changes"
-        )
-        return success
+        # Stage exactly the files step 2 edited instead of rescanning the worktree
+        commands = [
+            (["git", "add", "--", *sorted(self._modified_paths)], "Stage version changes"),
+            (["git", "commit", "-m", message], "Commit version changes"),
+        ]
+
+        for cmd, desc in commands:
+            success, _ = self._run_command(cmd, desc)
+            if not success:
+                return False
+
+        return True
 
     def step_4_update_changelog(self) -> bool:
         """Step 4: Update CHANGELOG.md (manual)"""
@@ -344,195 +837,642 @@ class ReleaseAutomation:
         return True
 
     def step_5_commit_changelog(self) -> bool:
-        """Step 5: Commit CHANGELOG.md"""
+        """Step 5: Commit CHANGELOG.md (pushed in step 6b)"""
         print("\n" + "=" * 70)
         print("STEP 5: Commit CHANGELOG.md")
         print("=" * 70)
 
         # Check if CHANGELOG.md has changes
-        success, output = self._run_command(
-            "git status --porcelain CHANGELOG.md",
-            "Check for CHANGELOG.md changes"
-        )
-
-        if not success:
+        has_changes = self._has_changes(["CHANGELOG.md"], "Check for CHANGELOG.md changes")
+        if has_changes is None:
             return False
 
-        if not output.strip():
+        if not has_changes:
             print("ℹ️  No changes to CHANGELOG.md, skipping")
             return True
 
-        success, _ = self._run_command(
-            'git add CHANGELOG.md && git commit -m "release: Update CHANGELOG.md" && git push',
-            "Commit and push CHANGELOG.md"
-        )
-        return success
+        commands = [
+            (["git", "add", "--", "CHANGELOG.md"], "Stage CHANGELOG.md"),
+            (["git", "commit", "-m", "release: Update CHANGELOG.md"], "Commit CHANGELOG.md"),
+        ]
+
+        for cmd, desc in commands:
+            success, _ = self._run_command(cmd, desc)
+            if not success:
+                return False
+
+        return True
 
     def step_6_create_tag(self) -> bool:
-        """Step 6: Create and push git tag"""
+        """Step 6: Create git tag (pushed in step 6b)"""
         print("\n" + "=" * 70)
         print(f"STEP 6: Create Git Tag v{self.version}")
         print("=" * 70)
 
         success, _ = self._run_command(
-            f'git tag -a v{self.version} -m "Release v{self.version}" && git push origin v{self.version}',
-            f"Create and push tag v{self.version}"
+            ["git", "tag", "-a", f"v{self.version}", "-m", f"Release v{self.version}"],
+            f"Create tag v{self.version}"
         )
         return success
 
-    def step_7_build_multiplatform(self) -> bool:
-        """Step 7: Build multi-platform binaries"""
+    def step_6b_push_all(self) -> bool:
+        """Step 6b: Push release commits and tag in a single atomic push"""
         print("\n" + "=" * 70)
-        print("STEP 7: Build Multi-Platform Binaries")
+        print(f"STEP 6b: Push Commits and Tag v{self.version}")
         print("=" * 70)
 
         success, _ = self._run_command(
-            "make build-all-platforms",
-            "Build all platform binaries"
+            ["git", "push", "--atomic", "origin", "HEAD", f"refs/tags/v{self.version}"],
+            f"Push commits and tag v{self.version}"
         )
         return success
 
-    def step_8_compress_binaries(self) -> bool:
-        """Step 8: Compress binaries into zip files"""
-        print("\n" + "=" * 70)
-        print("STEP 8: Compress Binaries")
-        print("=" * 70)
+    def _manifest_path(self) -> Path:
+        """Get the path of the build manifest recording previously built binaries"""
+        return self._target_dir / ".release-manifest.json"
 
-        # Create zip files for each platform
-        for platform in self.PLATFORMS:
-            binary_path = self._get_binary_path(platform)
-            zip_path = self._get_zip_path(platform)
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Load the build manifest (empty if missing or unreadable)"""
+        try:
+            return json.loads(self._manifest_path().read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, str]]):
+        """Write the build manifest atomically (write to temp file, then rename)"""
+        manifest_path = self._manifest_path()
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp_path, manifest_path)
+
+    def _source_fingerprint(self) -> str:
+        """
+        Fingerprint the source tree the binaries are built from
 
-            # Get binary extension
-            extension = self.PLATFORM_EXTENSIONS.get(platform, "")
-            source_binary = self.repo_path / "target" / platform / "release" / f"adaptive_pipeline{extension}"
+        Combines the committed contents of SOURCE_PATHS (their blob ids, not
+        the HEAD commit id, so commits touching other files such as the
+        CHANGELOG do not change it), any uncommitted changes to them, and the
+        contents of untracked and git-ignored sources, which git does not see.
 
-            # Create zip command
-            zip_dir = zip_path.parent
-            zip_name = zip_path.name
-            binary_name = binary_path.name
+        Returns:
+            Hex digest, or "" if the fingerprint could not be computed
+        """
+        try:
+            tree = subprocess.check_output(
+                ["git", "ls-tree", "-r", "HEAD", "--", *self.SOURCE_PATHS], cwd=self.repo_path
+            )
+            diff = subprocess.check_output(
+                ["git", "diff", "HEAD", "--", *self.SOURCE_PATHS], cwd=self.repo_path
+            )
+            untracked = subprocess.check_output(
+                ["git", "ls-files", "-z", "--others", "--exclude-standard", "--", *self.SOURCE_PATHS],
+                cwd=self.repo_path,
+            ).decode().split("\0")
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+        digest = hashlib.blake2b(tree + diff, digest_size=16)
+        for relative_path in sorted(set(filter(None, untracked)) | set(self.IGNORED_SOURCE_FILES)):
+            path = self.repo_path / relative_path
+            if not path.is_file():
+                continue
+            try:
+                file_digest = self._file_digest(path)
+            except OSError:
+                return ""
+            digest.update(f"{relative_path}\0{file_digest}\n".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Hash a file's contents"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _is_build_current(self, platform: str, fingerprint: str, manifest: Dict[str, Dict[str, str]]) -> bool:
+        """Check whether a platform's binary was already built from this source fingerprint"""
+        entry = manifest.get(platform)
+        binary_path = self._artifacts[platform].build_output_path
+        if not fingerprint or not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        if not binary_path.exists():
+            return False
+        return self._file_digest(binary_path) == entry.get("binary")
 
-            cmd = f"cd {source_binary.parent} && cp adaptive_pipeline{extension} {binary_name} && zip {zip_name} {binary_name} && rm {binary_name}"
+    def _get_build_log_path(self, platform: str) -> Path:
+        """Get the path of the build log for a platform"""
+        return self._cargo_target_dirs[platform] / "build.log"
 
-            success, _ = self._run_command(
-                cmd,
-                f"Create {zip_name}"
-            )
+    def _build_platform(self, platform: str) -> Tuple[bool, str]:
+        """
+        Cross-compile the release binary for a single platform
 
-            if not success:
-                print(f"❌ Failed to create zip for {platform}")
-                return False
+        Output goes straight to a per-platform log file rather than the
+        console, so concurrent builds neither interleave their logs nor
+        hold them in memory.
+
+        Args:
+            platform: Target triple to build
+
+        Returns:
+            Tuple of (success, last OUTPUT_TAIL_LINES lines of the log)
+        """
+        cmd = ["cross", "build", "--release", "--target", platform]
+        # Release artifacts never benefit from incremental compilation; force it off
+        # even if the developer's shell enables it globally
+        env = dict(
+            os.environ,
+            CROSS_LOG="info",
+            CARGO_INCREMENTAL="0",
+            CARGO_TARGET_DIR=str(self._cargo_target_dirs[platform]),
+        )
+        log_path = self._get_build_log_path(platform)
+
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, "w") as log:
+                # Launch under the lock so _cancel_builds cannot miss a starting build
+                with self._build_lock:
+                    if self._cancel_build.is_set():
+                        return False, "Build cancelled"
+                    process = subprocess.Popen(
+                        cmd,
+                        cwd=self.repo_path,
+                        env=env,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,  # Merge stderr into stdout
+                    )
+                    self._build_processes[platform] = process
+                try:
+                    returncode = process.wait()
+                finally:
+                    with self._build_lock:
+                        del self._build_processes[platform]
+            with open(log_path, errors="replace") as log:
+                tail = "".join(deque(log, maxlen=self.OUTPUT_TAIL_LINES))
+        except Exception as e:
+            return False, str(e)
+
+        return returncode == 0, tail
+
+    def _cancel_builds(self):
+        """Stop step 7: no further platform builds start and running ones are terminated"""
+        with self._build_lock:
+            self._cancel_build.set()
+            for process in self._build_processes.values():
+                process.terminate()
+
+    def step_7_build_multiplatform(self, log: Callable[[str], None] = print) -> bool:
+        """
+        Step 7: Build multi-platform binaries
 
+        Args:
+            log: Receives every console line of the step; prep_and_build_release
+                 collects them while the build runs in the background, so they
+                 do not interleave with the interactive prep steps
+        """
+        log("\n" + "=" * 70)
+        log("STEP 7: Build Multi-Platform Binaries")
+        log("=" * 70)
+
+        # Register every target with rustup up front, in one call: cross would otherwise
+        # run rustup per build, and concurrent installs into one toolchain are not safe
+        description = f"Add {len(self.PLATFORMS)} rustup targets"
+        success, output = self._run_command(
+            ["rustup", "target", "add", *self.PLATFORMS], description, quiet=True
+        )
         if not self.dry_run:
-            # Verify all zips were created
-            missing_zips = []
+            log(self._format_command_result(description, success, output))
+        if not success:
+            return False
+
+        if self.dry_run:
             for platform in self.PLATFORMS:
-                zip_path = self._get_zip_path(platform)
-                if not zip_path.exists():
-                    missing_zips.append(str(zip_path))
-
-            if missing_zips:
-                print(f"❌ Missing zip files:")
-                for zip_file in missing_zips:
-                    print(f"   - {zip_file}")
-                return False
+                log(f"[DRY RUN] Build {platform}")
+                log(f"          Command: cross build --release --target {platform}")
+                log(f"          Target dir: {self._cargo_target_dirs[platform]}")
+                log(f"          Working dir: {self.repo_path}")
+            return True
+
+        # Skip platforms whose binary was already built from the current sources
+        fingerprint = self._source_fingerprint()
+        manifest = self._load_manifest()
+        built_platforms = []
+        stale_platforms = []
+        for platform in self.PLATFORMS:
+            if self._is_build_current(platform, fingerprint, manifest):
+                log(f"ℹ️  {platform} is up to date, skipping build")
+            else:
+                stale_platforms.append(platform)
+
+        log(f"⏳ Building {len(stale_platforms)} platforms ({self.jobs} concurrent jobs)...")
+        failed_platforms = []
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {
+                executor.submit(self._build_platform, platform): platform
+                for platform in stale_platforms
+            }
+            for future in as_completed(futures):
+                platform = futures[future]
+                success, output = future.result()
+
+                if success:
+                    log(f"✅ Built {platform} (log: {self._get_build_log_path(platform)})")
+                    built_platforms.append(platform)
+                elif self._cancel_build.is_set():
+                    failed_platforms.append(platform)
+                else:
+                    log(f"\n----- {platform} (last {self.OUTPUT_TAIL_LINES} lines) -----")
+                    log(output.rstrip("\n"))
+                    log(f"❌ Failed to build {platform} (log: {self._get_build_log_path(platform)})")
+                    failed_platforms.append(platform)
+
+        # Record the builds against the fingerprint taken before they started, but only
+        # if the sources did not change while they ran (e.g. edits made during step 4)
+        if fingerprint and built_platforms:
+            if self._source_fingerprint() == fingerprint:
+                for platform in built_platforms:
+                    manifest[platform] = {
+                        "fingerprint": fingerprint,
+                        "binary": self._file_digest(self._artifacts[platform].build_output_path),
+                    }
+                self._save_manifest(manifest)
+            else:
+                log("ℹ️  Sources changed during the build; not recording it in the build manifest")
+
+        if self._cancel_build.is_set() and failed_platforms:
+            log(f"⏹️  Build cancelled ({len(failed_platforms)} platforms not built)")
+            return False
 
-            print(f"✅ All {len(self.PLATFORMS)} zip files created successfully")
+        if failed_platforms:
+            log("❌ Failed platform builds:")
+            for platform in failed_platforms:
+                log(f"   - {platform}")
+            return False
 
+        log(f"✅ All {len(self.PLATFORMS)} platforms built successfully")
         return True
 
+    @staticmethod
+    def _write_zip(source: Path, arcname: str, zip_path: Path):
+        """Write a single-file zip archive"""
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+            zf.write(source, arcname=arcname)
+
+    @staticmethod
+    def _write_tar_zst(source: Path, arcname: str, tar_zst_path: Path):
+        """Stream a single-file tar archive through a multi-threaded zstd compressor"""
+        compressor = zstandard.ZstdCompressor(level=6, threads=-1)
+        with open(tar_zst_path, "wb") as fh, compressor.stream_writer(fh) as writer:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                tar.add(source, arcname=arcname)
+
+    def _archive_writers(self, artifacts: PlatformArtifacts) -> List[Tuple[Path, Callable[[Path, str, Path], None]]]:
+        """Get the (archive path, writer) pairs of the release archives of a platform"""
+        return [
+            (artifacts.zip_path, self._write_zip),
+            (artifacts.tar_zst_path, self._write_tar_zst),
+        ]
+
+    def _compress_one(self, artifacts: PlatformArtifacts) -> Tuple[bool, str]:
+        """
+        Compress a platform's binary into its release zip and .tar.zst archives
+
+        Runs on a worker thread, so apart from dry runs it prints nothing;
+        step 8 reports the results.
+
+        Args:
+            artifacts: Artifacts of the platform whose binary to compress
+
+        Returns:
+            Tuple of (success, error message)
+        """
+        source_binary = artifacts.build_output_path
+        binary_name = artifacts.binary_path.name
+        archives = self._archive_writers(artifacts)
+
+        if self.dry_run:
+            for archive_path, _ in archives:
+                print(f"[DRY RUN] Create {archive_path.name}")
+                print(f"          Archive: {source_binary} as {binary_name}")
+                print(f"          Output: {archive_path}")
+            return True, ""
+
+        for archive_path, write_archive in archives:
+            try:
+                write_archive(source_binary, binary_name, archive_path)
+            except Exception as e:
+                # Don't leave a truncated archive behind for the verification/publish steps
+                archive_path.unlink(missing_ok=True)
+                return False, f"{archive_path.name}: {e}"
+
+        return True, ""
+
+    @staticmethod
+    def _list_dir(directory: Path) -> set:
+        """List a directory's entry names with a single readdir (empty if it does not exist)"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
+    def step_8_compress_binaries(self) -> bool:
+        """Step 8: Compress binaries into zip and .tar.zst files"""
+        print("\n" + "=" * 70)
+        print("STEP 8: Compress Binaries")
+        print("=" * 70)
+
+        artifacts = list(self._artifacts.values())
+
+        if self.dry_run:
+            # Sequential so the dry-run output is deterministic
+            for platform_artifacts in artifacts:
+                self._compress_one(platform_artifacts)
+            return True
+
+        # zlib and zstd release the GIL while compressing, so threads run in parallel
+        print(f"⏳ Compressing {len(artifacts)} binaries...")
+        with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+            results = list(executor.map(self._compress_one, artifacts))
+
+        for platform_artifacts, (success, _) in zip(artifacts, results):
+            if success:
+                for archive_path, _ in self._archive_writers(platform_artifacts):
+                    print(f"✅ Create {archive_path.name}")
+
+        # Report every failure, not just the first
+        failed_platforms = [
+            (platform_artifacts.platform, error)
+            for platform_artifacts, (success, error) in zip(artifacts, results)
+            if not success
+        ]
+        if failed_platforms:
+            print("❌ Failed to create archives for:")
+            for platform, error in failed_platforms:
+                print(f"   - {platform}: {error}")
+            return False
+
+        # Verify all archives were created (one listing per release directory instead of a stat per archive)
+        expected = [archive_path for a in artifacts for archive_path, _ in self._archive_writers(a)]
+        by_dir: Dict[Path, List[Path]] = {}
+        for path in expected:
+            by_dir.setdefault(path.parent, []).append(path)
+        missing_archives = []
+        for directory, paths in by_dir.items():
+            present = self._list_dir(directory)
+            missing_archives += [str(path) for path in paths if path.name not in present]
+        missing_archives.sort()
+
+        if missing_archives:
+            print(f"❌ Missing archive files:")
+            for archive_file in missing_archives:
+                print(f"   - {archive_file}")
+            return False
+
+        print(f"✅ All {len(expected)} archive files created successfully")
+        return True
+
+    def _upload_asset(self, asset: str) -> Tuple[bool, str]:
+        """Upload a single release asset to the GitHub release"""
+        return self._run_command(
+            ["gh", "release", "upload", f"v{self.version}", asset],
+            f"Upload {Path(asset).name}",
+            quiet=True,
+        )
+
     def step_9_publish_github(self) -> bool:
         """Step 9: Publish release to GitHub"""
         print("\n" + "=" * 70)
         print("STEP 9: Publish to GitHub")
         print("=" * 70)
 
-        # Build list of zip files
-        zip_files = [str(self._get_zip_path(platform)) for platform in self.PLATFORMS]
-        zip_args = " ".join(zip_files)
-
-        # Extract version section from CHANGELOG.md and pipe to gh release create
-        # Using awk to extract only the current version's section
-        # Pattern: Find "## [version]" header, print until next "## [" header or EOF
-        awk_script = (
-            f'BEGIN {{ p=0 }} '
-            f'/^## \\[{self.version}\\]/ {{ p=1; print; next }} '
-            f'/^## \\[/ {{ if (p) exit }} '
-            f'p {{ print }}'
-        )
+        asset_files = [
+            str(archive_path)
+            for artifacts in self._artifacts.values()
+            for archive_path, _ in self._archive_writers(artifacts)
+        ]
 
-        cmd = (
-            f"awk '{awk_script}' CHANGELOG.md | "
-            f"gh release create v{self.version} -F - --title \"Release v{self.version}\" --latest {zip_args}"
-        )
+        # Create a draft release without assets; they are uploaded concurrently
+        # below and the release is only made public once all of them are present
+        cmd = [
+            "gh", "release", "create", f"v{self.version}",
+            "-F", "-",
+            "--title", f"Release v{self.version}",
+            "--draft",
+        ]
 
         success, _ = self._run_command(
             cmd,
+            f"Create draft GitHub release v{self.version}",
+            stdin_text=self._release_notes()
+        )
+        if not success:
+            return False
+
+        if self.dry_run:
+            results = [self._upload_asset(asset_file) for asset_file in asset_files]
+        else:
+            # Upload quietly and report once all are done, so the outputs do not interleave
+            print(f"⏳ Uploading {len(asset_files)} assets...")
+            with ThreadPoolExecutor(max_workers=len(asset_files)) as executor:
+                results = list(executor.map(self._upload_asset, asset_files))
+            for asset_file, (success, output) in zip(asset_files, results):
+                print(self._format_command_result(f"Upload {Path(asset_file).name}", success, output))
+
+        failed_uploads = [asset_file for asset_file, (success, _) in zip(asset_files, results) if not success]
+        if failed_uploads:
+            print("❌ Failed asset uploads:")
+            for asset_file in failed_uploads:
+                print(f"   - {asset_file}")
+
+            # Don't leave a partially populated draft behind
+            self._run_command(
+                ["gh", "release", "delete", f"v{self.version}", "--yes"],
+                f"Delete incomplete GitHub release v{self.version}"
+            )
+            return False
+
+        success, _ = self._run_command(
+            ["gh", "release", "edit", f"v{self.version}", "--draft=false", "--latest"],
             f"Publish GitHub release v{self.version}"
         )
-        return success
+        if not success:
+            return False
 
-    def prep_release(self) -> bool:
-        """Run preparation steps (1-6)"""
-        print("\n" + "🎯" * 35)
-        print("PHASE: PREP RELEASE (Steps 1-6)")
-        print("🎯" * 35)
+        print(f"✅ Published GitHub release v{self.version} with {len(asset_files)} assets")
+        return True
 
-        steps = [
+    def step_1_2_prepare_and_set_version(self) -> bool:
+        """Steps 1 and 2 run concurrently (they touch disjoint state)"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            environment = executor.submit(self.step_1_prepare_environment)
+            version = executor.submit(self.step_2_set_version)
+            # Wait for both so neither is left running on failure
+            return all([environment.result(), version.result()])
+
+    def _setup_steps(self) -> List[Tuple]:
+        """Get the (step, name) entries for steps 1-2, combined under --parallel-prep"""
+        if self.parallel_prep and not self.dry_run:
+            return [(self.step_1_2_prepare_and_set_version, "Prepare environment + set version")]
+        return [
             (self.step_1_prepare_environment, "Prepare environment"),
             (self.step_2_set_version, "Set version"),
-            (lambda: self.step_3_commit_changes(f"chore: bump version to v{self.version}"), "Commit changes"),
-            (self.step_4_update_changelog, "Update CHANGELOG"),
-            (self.step_5_commit_changelog, "Commit CHANGELOG"),
-            (self.step_6_create_tag, "Create git tag"),
         ]
 
+    @staticmethod
+    def _print_phase_banner(icon: str, title: str):
+        """Print the header of a release phase"""
+        print("\n" + icon * 35)
+        print(f"PHASE: {title}")
+        print(icon * 35)
+
+    @staticmethod
+    def _print_phase_completed(title: str):
+        """Print the success footer of a release phase"""
+        print("\n" + "✅" * 35)
+        print(f"{title} COMPLETED SUCCESSFULLY")
+        print("✅" * 35)
+
+    def _run_steps(self, steps: List[Tuple], phase: str) -> bool:
+        """
+        Run (step, name) entries in order, stopping at the first failure
+
+        Args:
+            steps: (step function, step name) pairs
+            phase: Phase name used in the failure message (e.g., "PREP")
+
+        Returns:
+            True if every step succeeded
+        """
         for i, (step_func, step_name) in enumerate(steps, 1):
             print(f"\n>>> Starting Step {i}/{len(steps)}: {step_name}")
             if not step_func():
-                print(f"\n❌ PREP FAILED at: {step_name}")
+                print(f"\n❌ {phase} FAILED at: {step_name}")
                 return False
+        return True
 
-        print("\n" + "✅" * 35)
-        print("PREP RELEASE COMPLETED SUCCESSFULLY")
-        print("✅" * 35)
+    def _commit_version_step(self) -> Tuple:
+        """Get the (step, name) entry of step 3"""
+        return (lambda: self.step_3_commit_changes(f"chore: bump version to v{self.version}"), "Commit changes")
+
+    def _changelog_steps(self) -> List[Tuple]:
+        """Get the (step, name) entries of steps 4-5"""
+        return [
+            (self.step_4_update_changelog, "Update CHANGELOG"),
+            (self.step_5_commit_changelog, "Commit CHANGELOG"),
+        ]
+
+    def _tag_and_push_steps(self) -> List[Tuple]:
+        """Get the (step, name) entries of steps 6-6b"""
+        return [
+            (self.step_6_create_tag, "Create git tag"),
+            (self.step_6b_push_all, "Push commits and tag"),
+        ]
+
+    def prep_release(self) -> bool:
+        """Run preparation steps (1-6)"""
+        self._print_phase_banner("🎯", "PREP RELEASE (Steps 1-6)")
+
+        steps = [
+            *self._setup_steps(),
+            self._commit_version_step(),
+            *self._changelog_steps(),
+            *self._tag_and_push_steps(),
+        ]
+        if not self._run_steps(steps, "PREP"):
+            return False
+
+        self._print_phase_completed("PREP RELEASE")
         return True
 
     def build_release(self) -> bool:
         """Run build steps (7-8)"""
-        print("\n" + "🔨" * 35)
-        print("PHASE: BUILD RELEASE (Steps 7-8)")
-        print("🔨" * 35)
+        self._print_phase_banner("🔨", "BUILD RELEASE (Steps 7-8)")
 
         steps = [
             (self.step_7_build_multiplatform, "Build binaries"),
             (self.step_8_compress_binaries, "Compress binaries"),
         ]
+        if not self._run_steps(steps, "BUILD"):
+            return False
 
-        for i, (step_func, step_name) in enumerate(steps, 1):
-            print(f"\n>>> Starting Step {i}/{len(steps)}: {step_name}")
-            if not step_func():
-                print(f"\n❌ BUILD FAILED at: {step_name}")
-                return False
+        self._print_phase_completed("BUILD RELEASE")
+        return True
 
-        print("\n" + "✅" * 35)
-        print("BUILD RELEASE COMPLETED SUCCESSFULLY")
-        print("✅" * 35)
+    def prep_and_build_release(self) -> bool:
+        """
+        Run preparation and build steps (1-8), overlapping the build with prep
+
+        Steps 4-6b only touch CHANGELOG.md and git refs, so once the version
+        bump is committed (step 3) the build (step 7) runs in a background
+        thread while they complete. Compression (step 8) waits for both. If
+        one of the overlapped steps fails, the build is cancelled; if the build
+        has already failed by step 6, nothing is tagged or pushed.
+        """
+        self._print_phase_banner("🎯", "PREP + BUILD RELEASE (Steps 1-8, build overlapped)")
+
+        if not self._run_steps([*self._setup_steps(), self._commit_version_step()], "PREP"):
+            return False
+
+        # subprocess-bound, so the build thread does not contend for the GIL. Its
+        # console output is held back until it is joined, so it cannot bury the
+        # CHANGELOG prompt of step 4
+        build_result = {}
+        build_output: List[str] = []
+        build_thread = threading.Thread(
+            target=lambda: build_result.update(success=self.step_7_build_multiplatform(build_output.append)),
+            name="build-multiplatform",
+        )
+        print("\n>>> Starting background build: Build binaries (output follows once prep is done)")
+        build_thread.start()
+
+        def unless_build_failed(step_func):
+            # Don't tag or push a release whose build is already known to have failed
+            def run() -> bool:
+                if build_result.get("success") is False:
+                    print("❌ Background build failed; not tagging or pushing")
+                    return False
+                return step_func()
+            return run
+
+        overlapped_steps = [
+            *self._changelog_steps(),
+            *[(unless_build_failed(step_func), step_name) for step_func, step_name in self._tag_and_push_steps()],
+        ]
+        prep_succeeded = self._run_steps(overlapped_steps, "PREP")
+        if not prep_succeeded and build_thread.is_alive():
+            print("⏹️  Cancelling background build...")
+            self._cancel_builds()
+        elif build_thread.is_alive():
+            print("\n⏳ Waiting for background build to finish...")
+
+        build_thread.join()
+        print("\n".join(build_output))
+        if not prep_succeeded:
+            return False
+        if not build_result.get("success"):
+            print("\n❌ BUILD FAILED at: Build binaries")
+            return False
+
+        if not self._run_steps([(self.step_8_compress_binaries, "Compress binaries")], "BUILD"):
+            return False
+
+        self._print_phase_completed("PREP + BUILD RELEASE")
         return True
 
     def publish_release(self) -> bool:
         """Run publish step (9)"""
-        print("\n" + "📦" * 35)
-        print("PHASE: PUBLISH RELEASE (Step 9)")
-        print("📦" * 35)
+        self._print_phase_banner("📦", "PUBLISH RELEASE (Step 9)")
 
-        if not self.step_9_publish_github():
-            print("\n❌ PUBLISH FAILED")
+        if not self._run_steps([(self.step_9_publish_github, "Publish to GitHub")], "PUBLISH"):
             return False
 
-        print("\n" + "✅" * 35)
-        print("PUBLISH RELEASE COMPLETED SUCCESSFULLY")
-        print("✅" * 35)
+        self._print_phase_completed("PUBLISH RELEASE")
         return True
 
     def run_all(self) -> bool:
@@ -541,9 +1481,13 @@ class ReleaseAutomation:
         print(f"FULL RELEASE AUTOMATION: v{self.version}")
         print("🚀" * 35)
 
-        if not self.prep_release():
-            return False
-        if not self.build_release():
+        # Dry runs stay serial so their output reads in step order
+        if self.serial or self.dry_run:
+            if not self.prep_release():
+                return False
+            if not self.build_release():
+                return False
+        elif not self.prep_and_build_release():
             return False
         if not self.publish_release():
             return False
@@ -557,6 +1501,16 @@ class ReleaseAutomation:
         return True
 
 
+def default_jobs() -> int:
+    """
+    Default number of concurrent platform builds
+
+    Each build runs its own rustc/LLVM (in its own container), so allow at
+    most one build per two cores to keep memory use in check.
+    """
+    return max(1, min(len(ReleaseAutomation.PLATFORMS), (os.cpu_count() or 1) // 2))
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -614,20 +1568,56 @@ Examples:
         action="store_true",
         help="Print commands without executing them"
     )
+    parser.add_argument(
+        "--parallel-prep",
+        action="store_true",
+        help="Install cross (step 1) while the version is being set (step 2)"
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="With --all, run every step in order instead of overlapping the build with prep"
+    )
+    parser.add_argument(
+        "--refresh-tools",
+        action="store_true",
+        help="Reinstall cross even if the installed build is up to date"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        metavar="N",
+        help="Number of platforms to build concurrently (default: %(default)s)"
+    )
 
     args = parser.parse_args()
 
     # Validate that at least one action is specified
     if not any([args.prep, args.build, args.publish, args.all]):
         parser.error("Must specify at least one action: --prep, --build, --publish, or --all")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Create automation instance
     automation = ReleaseAutomation(
         version=args.version,
         repo_path=args.repopath,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        jobs=args.jobs,
+        refresh_tools=args.refresh_tools,
+        serial=args.serial,
+        parallel_prep=args.parallel_prep
     )
 
+    # Fail fast on missing tools or credentials before doing any real work
+    if not args.dry_run and not automation.preflight(
+        prep=args.prep or args.all,
+        build=args.build or args.all,
+        publish=args.publish or args.all,
+    ):
+        sys.exit(1)
+
     # Run requested steps
     success = True
 